@@ -13,17 +13,26 @@ Veille IA – Militaire (Marine)
 import os
 import re
 import html
+import json
 import time
 import logging
 import hashlib
+import itertools
+import unicodedata
+import calendar
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple, Set
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Set
 from datetime import datetime, timezone, timedelta
 
 import requests
 import feedparser
-from dateutil import parser as date_parser
+import ahocorasick
+from lxml import etree
 
 # =========================== Config ===========================
 
@@ -33,10 +42,17 @@ class Config:
     relevance_min: float = float(os.getenv("RELEVANCE_MIN", "0.28"))
     max_summary_chars: int = int(os.getenv("MAX_SUMMARY_CHARS", "300"))
     offline_translation: bool = os.getenv("OFFLINE_TRANSLATION", "0") == "1"
+    translation_threads: int = int(os.getenv("TRANSLATION_THREADS", "0"))
+    translation_compute_type: str = os.getenv("TRANSLATION_COMPUTE_TYPE", "int8")
+    translation_cache: bool = os.getenv("TRANSLATION_CACHE", "1") == "1"
     output_dir: Path = Path("docs")
     output_file: str = "index.html"
+    cache_dir: Path = Path(os.getenv("CACHE_DIR", ".cache"))
     request_timeout: int = 25
     max_retries: int = 3
+    fetch_workers: int = int(os.getenv("FETCH_WORKERS", "8"))
+    analysis_workers: int = int(os.getenv("ANALYSIS_WORKERS", "1"))
+    article_cache: bool = os.getenv("ARTICLE_CACHE", "1") == "1"
     user_agent: str = "VeilleIA-Military/2.1 (+https://github.com/guillaume7625/veille-ia-marine)"
 
 config = Config()
@@ -167,6 +183,8 @@ EXCLUSION_PATTERNS = [
     r"\b(smartphone|tablet|gadget|consumer|grand public)\b",
     r"\b(rumeur|rumor|leak|spoiler|speculation)\b",
 ]
+# Une seule passe regex pour toutes les exclusions (texte déjà normalisé/minuscule)
+EXCLUSION_RE = re.compile("|".join(f"(?:{p})" for p in EXCLUSION_PATTERNS))
 
 # Patterns stricts IA / Défense
 AI_PATTERNS = [
@@ -187,8 +205,36 @@ DEF_PATTERNS = [
     r"\b(drone|uav|uas|usv|uuv|unmanned|autonom(?:e|ous)|swarm|essaim)\b",
 ]
 
-AI_PATTERNS_RE = [re.compile(p, re.IGNORECASE) for p in AI_PATTERNS]
-DEF_PATTERNS_RE = [re.compile(p, re.IGNORECASE) for p in DEF_PATTERNS]
+# Une alternance par famille : une seule recherche au lieu d'une par pattern
+AI_UNION_RE = re.compile("|".join(f"(?:{p})" for p in AI_PATTERNS), re.IGNORECASE)
+DEF_UNION_RE = re.compile("|".join(f"(?:{p})" for p in DEF_PATTERNS), re.IGNORECASE)
+
+# Catégories (première règle qui matche gagne, sinon TECHNOLOGY)
+CATEGORY_PATTERNS = [
+    ("POLICY", r"\b(policy|réglementation|regulation|budget|appropriation|spending|bill|award|contract|option year|procurement|acquisition)\b"),
+    ("DEVELOPMENT", r"\b(prototype|trial|essai|r&d|laboratoire|lab|research|paper)\b"),
+    ("OPERATIONAL", r"\b(deployment|deployed|fielded|opérationnel|operational|exercise|exercice)\b"),
+    ("THREAT", r"\b(threat|menace|intrusion|ransomware|ew|electronic warfare|counter-uas|counter uas)\b"),
+    ("PARTNERSHIP", r"\b(partnership|alliance|accord|coopération|framework|mou|moa)\b"),
+]
+CATEGORY_RES = [(re.compile(p), label) for label, p in CATEGORY_PATTERNS]
+
+# Tags thématiques
+TAG_PATTERNS = [
+    ("LLM/Génératif", r"\b(llm|large language model|génératif|generative ai|diffusion model|gan)\b"),
+    ("Vision Artificielle", r"\b(computer vision|vision par ordinateur)\b"),
+    ("NLP", r"\b(nlp|traitement du langage|natural language processing)\b"),
+    ("Naval", r"\b(naval|marine|navy|sous-?marin|submarine|destroyer|frégate|fregate|maritime)\b"),
+    ("C4ISR", r"\b(c4isr|c2|isr|command|control|surveillance|reconnaissance)\b"),
+    ("Cybersécurité", r"\b(cyber|cybersécurité|cybersecurity|ransomware|malware|intrusion)\b"),
+    ("Systèmes Autonomes", r"\b(drone|uav|uas|usv|uuv|unmanned|autonom(?:e|ous)|swarm|essaim)\b"),
+    ("R&D", r"\b(prototype|research|laboratoire|laboratory|paper)\b"),
+    ("Opérationnel", r"\b(deployment|deployed|fielded|operational|opérationnel|exercise|exercice)\b"),
+]
+TAG_RES = [(re.compile(p), tag) for tag, p in TAG_PATTERNS]
+
+# Nettoyage HTML (les espaces sont compactés par str.split, mêmes blancs Unicode que \s)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 # Nettoyage trailers “The post … appeared first on …”
 POST_FOOTER_RE = re.compile(
@@ -208,53 +254,127 @@ logger = logging.getLogger(__name__)
 
 # =========================== Utils ============================
 
+def _fold_char(c: str) -> str:
+    return "".join(x for x in unicodedata.normalize("NFKD", c) if not unicodedata.combining(x))
+
+# Table de repli des accents (NFKD sans diacritiques), précalculée pour U+0080–U+2FFF :
+# latin, grec, cyrillique, ponctuation, symboles et diacritiques combinants.
+_FOLD_LIMIT = "\u3000"
+_FOLD_TABLE = {
+    cp: folded
+    for cp in range(0x80, ord(_FOLD_LIMIT))
+    if (folded := _fold_char(chr(cp))) != chr(cp)
+}
+
+@lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
     if not text:
         return ""
-    import unicodedata
     t = text.lower()
+    if t.isascii():
+        return t
+    t = t.translate(_FOLD_TABLE)
+    if t.isascii() or max(t) < _FOLD_LIMIT:
+        return t
+    # Caractères hors table (CJK, plans supplémentaires…) : chemin NFKD complet
     t = unicodedata.normalize("NFKD", t)
-    t = "".join(c for c in t if not unicodedata.combining(c))
-    return t
+    return "".join(c for c in t if not unicodedata.combining(c))
 
 def strip_html(text: str) -> str:
     if not text:
         return ""
-    t = re.sub(r"<[^>]+>", " ", text)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    return " ".join(HTML_TAG_RE.sub(" ", text).split())
 
 def clean_rss_boilerplate(text: str) -> str:
     if not text:
         return ""
     t = html.unescape(text)
     t = strip_html(t)
-    t = POST_FOOTER_RE.sub("", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    return " ".join(POST_FOOTER_RE.sub("", t).split())
 
-def split_sentences(text: str) -> List[str]:
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[\.\!\?])\s+")
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Phrases non vides, produites à la demande (permet un arrêt anticipé)."""
     if not text:
-        return []
-    parts = re.split(r"(?<=[\.\!\?])\s+", text)
-    return [p.strip() for p in parts if p.strip()]
+        return
+    start = 0
+    for m in SENTENCE_BOUNDARY_RE.finditer(text):
+        part = text[start:m.start()].strip()
+        if part:
+            yield part
+        start = m.end()
+    part = text[start:].strip()
+    if part:
+        yield part
 
+def split_sentences(text: str) -> List[str]:
+    return list(iter_sentences(text))
+
+_FR_STOPWORDS = frozenset(("le", "la", "les", "un", "une", "des", "du", "de",
+                           "qui", "que", "est", "sont", "avec", "dans", "pour"))
+_EN_STOPWORDS = frozenset(("the", "and", "with", "from", "that", "this", "which",
+                           "what", "can", "will", "would", "should", "have", "has"))
+
+def parse_date_string(s: str) -> datetime:
+    """RFC 822 (RSS) puis ISO 8601 (Atom) via la stdlib ; dateutil (lent) en dernier recours."""
+    try:
+        return parsedate_to_datetime(s)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
+    from dateutil import parser as date_parser
+    return date_parser.parse(s)
+
+@lru_cache(maxsize=2048)
 def detect_language_simple(text: str) -> str:
     if not text:
         return "unknown"
-    t = f" {text.lower()} "
-    fr = [' le ', ' la ', ' les ', ' un ', ' une ', ' des ', ' du ', ' de ',
-          ' qui ', ' que ', ' est ', ' sont ', ' avec ', ' dans ', ' pour ']
-    en = [' the ', ' and ', ' with ', ' from ', ' that ', ' this ', ' which ',
-          ' what ', ' can ', ' will ', ' would ', ' should ', ' have ', ' has ']
-    fs = sum(1 for m in fr if m in t)
-    es = sum(1 for m in en if m in t)
+    # Mots délimités par des espaces (équivalent aux anciens tests « ' le ' in t »)
+    tokens = set(text.lower().split(" "))
+    fs = len(_FR_STOPWORDS & tokens)
+    es = len(_EN_STOPWORDS & tokens)
     if fs > es:
         return "fr"
     if es > fs:
         return "en"
     return "unknown"
 
+# ================= Vocabulaire normalisé (import) ================
+
+# (poids, termes normalisés) par catégorie sémantique, calculés une seule fois
+SEMANTIC_NORMALIZED: List[Tuple[int, Tuple[str, ...]]] = [
+    (data["weight"], tuple(normalize_text(t) for t in data["terms"]))
+    for data in SEMANTIC_KEYWORDS.values()
+]
+# Contexte défense fort : lève une exclusion « bruit »
+DEFENSE_CTX_TERMS_NORM: frozenset = frozenset(
+    normalize_text(t)
+    for cat in ("naval_platforms", "defense_systems", "c4isr")
+    for t in SEMANTIC_KEYWORDS[cat]["terms"]
+)
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    # Un terme présent dans plusieurs listes (ex. « frégate »/« fregate ») cumule ses poids
+    weights: Dict[str, int] = {}
+    for w, terms in SEMANTIC_NORMALIZED:
+        for term in terms:
+            weights[term] = weights.get(term, 0) + w
+    ac = ahocorasick.Automaton()
+    for term, w in weights.items():
+        ac.add_word(term, (term, w))
+    ac.make_automaton()
+    return ac
+
+KEYWORD_AC = _build_keyword_automaton()
+
+def keyword_hits(text_norm: str) -> Dict[str, int]:
+    """Termes du vocabulaire présents (sous-chaîne) dans un texte normalisé → poids cumulé."""
+    return {term: w for _, (term, w) in KEYWORD_AC.iter(text_norm)}
+
 # ======================= Modèle d'article =====================
 
 @dataclass
@@ -271,22 +391,75 @@ class Article:
     priority_level: str = "LOW"
     category: str = "TECHNOLOGY"
     tags: List[str] = None
+    # Titre + résumé normalisés (calculés une fois par process_entry, relus par les scores)
+    normalized: str = field(default="", repr=False)
+    # Termes IA et défense présents (bonus de co-occurrence du score de pertinence)
+    ai_defense: bool = field(default=False, repr=False)
+    # Empreinte 64 bits stable d'une exécution à l'autre (dédup, pas de cryptographie)
+    hash_id: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
-
-    @property
-    def hash_id(self) -> str:
-        return hashlib.md5(f"{self.title}|{self.link}".encode("utf-8")).hexdigest()
+        digest = hashlib.blake2b(f"{self.title}|{self.link}".encode("utf-8"), digest_size=8).digest()
+        self.hash_id = int.from_bytes(digest, "big")
 
 # ===================== Traduction offline =====================
 
+class TranslationCache:
+    """Traductions EN→FR déjà calculées (clé BLAKE2b du texte source), persistées entre exécutions.
+
+    Une traduction inutilisée depuis plus de 2 × DAYS_WINDOW jours est purgée à l'écriture.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, List] = self._load()  # clé -> [traduction, dernier usage (ts)]
+
+    def _load(self) -> Dict[str, List]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache de traduction illisible, ignoré: {e}")
+            return {}
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def translations(self) -> Dict[str, str]:
+        return {k: v[0] for k, v in self.entries.items()}
+
+    def update(self, used: Dict[str, str], now_ts: float):
+        for k, translated in used.items():
+            self.entries[k] = [translated, now_ts]
+
+    def save(self, now_ts: float):
+        horizon = now_ts - 2 * config.days_window * 86400
+        entries = {k: v for k, v in self.entries.items() if v[1] >= horizon}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Cache de traduction non écrit: {e}")
+
 class TranslationService:
-    def __init__(self):
+    def __init__(self, known: Optional[Dict[str, str]] = None):
         self.available = False
         self.translation = None
-        self._setup()
+        # Traductions connues (TranslationCache) et celles servies pendant cette exécution
+        self.known: Dict[str, str] = known if known is not None else {}
+        self.used: Dict[str, str] = {}
+        # Argos n'est chargé qu'au premier texte à traduire (aucun si tout est déjà en français)
+        self._set_up = False
+
+    def _ready(self) -> bool:
+        if not self._set_up:
+            self._set_up = True
+            self._setup()
+        return self.available and self.translation is not None
 
     def _setup(self):
         if not config.offline_translation:
@@ -309,36 +482,158 @@ class TranslationService:
         except Exception as e:
             logger.warning(f"⚠️ Argos indisponible: {e}")
 
+    @staticmethod
+    def _accept(text: str, out: str) -> Tuple[str, bool]:
+        if out and out.strip() and out.strip() != text.strip():
+            return out, True
+        return text, False
+
     def translate_en_to_fr(self, text: str) -> Tuple[str, bool]:
-        if not text or not self.available or self.translation is None:
+        if not text or not self._ready():
             return text, False
         try:
-            out = self.translation.translate(text)
-            if out and out.strip() and out.strip() != text.strip():
-                return out, True
-            return text, False
+            return self._accept(text, self.translation.translate(text))
         except Exception as e:
             logger.warning(f"Erreur traduction: {e}")
             return text, False
 
+    def _batch_backend(self):
+        """Paquet Argos et modèle CTranslate2 sous-jacents (None si la traduction n'en expose pas)."""
+        underlying = getattr(self.translation, "underlying", self.translation)
+        pkg = getattr(underlying, "pkg", None)
+        if pkg is None or not hasattr(underlying, "translator"):
+            return None
+        if underlying.translator is None:
+            # Même initialisation paresseuse qu'Argos (PackageTranslation.hypotheses),
+            # avec le type de calcul (int8 par défaut) et les threads CPU réglables
+            import ctranslate2
+            from argostranslate import settings as argos_settings
+            underlying.translator = ctranslate2.Translator(str(pkg.package_path / "model"),
+                                                           device=argos_settings.device,
+                                                           compute_type=config.translation_compute_type,
+                                                           intra_threads=config.translation_threads)
+        return pkg, underlying.translator
+
+    def translate_many(self, texts: List[str]) -> List[Tuple[str, bool]]:
+        """Traduit une liste de résumés ; seuls ceux absents des traductions connues passent au modèle.
+
+        Les traductions connues sont servies même si le modèle n'est pas disponible ;
+        les autres textes restent alors en anglais.
+        """
+        results: List[Tuple[str, bool]] = [(t, False) for t in texts]
+        # Textes inconnus, dédupliqués (même dépêche reprise par plusieurs flux) : clé -> indices
+        misses: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            key = TranslationCache.key(text)
+            known = self.known.get(key)
+            if known is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                results[i] = (known, True)
+                self.used[key] = known
+        if not misses:
+            # Tout vient du cache : Argos n'est pas chargé
+            return results
+        translated = self._translate_batch([texts[idx[0]] for idx in misses.values()])
+        for (key, idx), res in zip(misses.items(), translated):
+            for i in idx:
+                results[i] = res
+            if res[1]:
+                self.known[key] = self.used[key] = res[0]
+        return results
+
+    def take_used(self) -> Dict[str, str]:
+        """Traductions servies depuis le dernier appel (clé -> texte), pour le cache disque."""
+        used, self.used = self.used, {}
+        return used
+
+    def _translate_batch(self, texts: List[str]) -> List[Tuple[str, bool]]:
+        """Traduit une liste de résumés en un seul translate_batch (phrases de tous les textes).
+
+        Reprend les paramètres d'Argos (apply_packaged_translation) ; les résumés faisant au plus
+        deux phrases déjà découpées, le découpage d'Argos (stanza / modèle sbd) est remplacé
+        par split_sentences. Repli texte par texte si le modèle n'est pas accessible.
+        """
+        if not texts or not self._ready():
+            return [(t, False) for t in texts]
+        try:
+            backend = self._batch_backend()
+        except Exception as e:
+            logger.warning(f"Traduction par lot indisponible: {e}")
+            backend = None
+        if backend is None:
+            return [self.translate_en_to_fr(t) for t in texts]
+        pkg, translator = backend
+
+        owners: List[int] = []
+        tokenized = []
+        results: List[Tuple[str, bool]] = [(t, False) for t in texts]
+        try:
+            for i, text in enumerate(texts):
+                for sentence in split_sentences(text) if text else []:
+                    owners.append(i)
+                    tokenized.append(pkg.tokenizer.encode(sentence))
+            if not tokenized:
+                return results
+            target_prefix = [[pkg.target_prefix]] * len(tokenized) if pkg.target_prefix else None
+            batch = translator.translate_batch(
+                tokenized, target_prefix=target_prefix, replace_unknowns=True,
+                max_batch_size=32, beam_size=4, num_hypotheses=1, length_penalty=0.2,
+            )
+            tokens: Dict[int, List[str]] = {}
+            for i, res in zip(owners, batch):
+                tokens.setdefault(i, []).extend(res.hypotheses[0])
+            for i, toks in tokens.items():
+                out = pkg.tokenizer.decode(toks)
+                if pkg.target_prefix and out.startswith(pkg.target_prefix):
+                    out = out[len(pkg.target_prefix):]
+                if out.startswith(" "):
+                    out = out[1:]
+                results[i] = self._accept(texts[i], out)
+        except Exception as e:
+            # Internes Argos (tokenizer, préfixe, modèle) : toute erreur retombe sur la traduction texte par texte
+            logger.warning(f"Erreur traduction par lot: {e}")
+            return [self.translate_en_to_fr(t) for t in texts]
+        return results
+
 # ====================== Analyse de contenu =====================
 
+@dataclass
+class PendingEntry:
+    """Entrée retenue par le filtre rapide, en attente de traduction."""
+    src_name: str
+    meta: Dict
+    title: str
+    link: str
+    base: str
+    language: str
+    date: Optional[datetime]
+    needs_translation: bool
+
+def compute_relevance(sem: float, authority: float, age_s: float, ai_defense: bool) -> float:
+    # fraîcheur (demi-vie ~3 jours)
+    age_h = max(0.0, age_s / 3600.0)
+    freshness = max(0.5, 2 ** (-age_h / 72.0))
+    co = 1.3 if ai_defense else 1.0
+    score = (sem * authority * freshness * co) / 10.0
+    return max(0.0, min(1.5, score))
+
 class ContentAnalyzer:
-    def __init__(self):
-        self.translator = TranslationService()
+    def __init__(self, now: Optional[datetime] = None, translations: Optional[Dict[str, str]] = None):
+        self.translator = TranslationService(translations)
+        # Horloge figée pour toute l'exécution (fraîcheur, date par défaut, fenêtre)
+        self.now = now or datetime.now(timezone.utc)
+        self.now_ts = self.now.timestamp()
 
     # --- Détection IA / Défense ---
     def _has_ai(self, text: str) -> bool:
-        t = text or ""
-        return any(p.search(t) for p in AI_PATTERNS_RE)
+        return AI_UNION_RE.search(text or "") is not None
 
     def _has_defense(self, text: str) -> bool:
-        t = text or ""
-        return any(p.search(t) for p in DEF_PATTERNS_RE)
+        return DEF_UNION_RE.search(text or "") is not None
 
     def _cooccurs_ai_def_in_title_or_sentence(self, title: str, summary: str) -> bool:
-        scopes = [title] + split_sentences(summary)
-        for scope in scopes:
+        for scope in itertools.chain((title,), iter_sentences(summary)):
             s = scope.lower()
             if self._has_ai(s) and self._has_defense(s):
                 return True
@@ -346,108 +641,74 @@ class ContentAnalyzer:
 
     # --- Exclusions bruit (avec exception si contexte défense fort) ---
     def is_excluded(self, text_norm: str) -> bool:
-        for pattern in EXCLUSION_PATTERNS:
-            if re.search(pattern, text_norm):
-                defense_ctx_terms = (
-                    SEMANTIC_KEYWORDS["naval_platforms"]["terms"] +
-                    SEMANTIC_KEYWORDS["defense_systems"]["terms"] +
-                    SEMANTIC_KEYWORDS["c4isr"]["terms"]
-                )
-                if not any(normalize_text(t) in text_norm for t in defense_ctx_terms):
-                    return True
-        return False
+        if not EXCLUSION_RE.search(text_norm):
+            return False
+        return DEFENSE_CTX_TERMS_NORM.isdisjoint(keyword_hits(text_norm))
 
     # --- Scores & classements ---
-    def _keyword_score(self, text: str) -> int:
-        t = normalize_text(text)
-        score = 0
-        for _, data in SEMANTIC_KEYWORDS.items():
-            w = data["weight"]
-            for term in data["terms"]:
-                if normalize_text(term) in t:
-                    score += w
-        return score
-
-    def _relevance_score(self, article: Article, authority: float) -> float:
-        t = normalize_text(f"{article.title} {article.summary}")
-        sem = 0.0
-        for _, data in SEMANTIC_KEYWORDS.items():
-            w = data["weight"]
-            for term in data["terms"]:
-                if normalize_text(term) in t:
-                    sem += 0.1 * w
-        # fraîcheur (demi-vie ~3 jours)
-        age_h = max(0.0, (datetime.now(timezone.utc) - article.date).total_seconds() / 3600.0)
-        freshness = max(0.5, 2 ** (-age_h / 72.0))
-        # bonus co-occurrence
-        co = 1.3 if (self._has_ai(t) and self._has_defense(t)) else 1.0
-        score = (sem * authority * freshness * co) / 10.0
-        return max(0.0, min(1.5, score))
-
-    def classify_category(self, text: str) -> str:
-        t = text.lower()
-        if re.search(r"\b(policy|réglementation|regulation|budget|appropriation|spending|bill|award|contract|option year|procurement|acquisition)\b", t):
-            return "POLICY"
-        if re.search(r"\b(prototype|trial|essai|r&d|laboratoire|lab|research|paper)\b", t):
-            return "DEVELOPMENT"
-        if re.search(r"\b(deployment|deployed|fielded|opérationnel|operational|exercise|exercice)\b", t):
-            return "OPERATIONAL"
-        if re.search(r"\b(threat|menace|intrusion|ransomware|ew|electronic warfare|counter-uas|counter uas)\b", t):
-            return "THREAT"
-        if re.search(r"\b(partnership|alliance|accord|coopération|framework|mou|moa)\b", t):
-            return "PARTNERSHIP"
+    # Article.normalized et les paramètres « _lower » évitent de recalculer une forme
+    # du texte déjà produite par process_entry.
+    @staticmethod
+    def _normalized(article: Article) -> str:
+        return article.normalized or normalize_text(f"{article.title} {article.summary}")
+
+    # « hits » : résultat de keyword_hits déjà calculé pour l'article (une seule passe automate)
+    def _keyword_score(self, article: Article, hits: Optional[Dict[str, int]] = None) -> int:
+        if hits is None:
+            hits = keyword_hits(self._normalized(article))
+        return sum(hits.values())
+
+    def _relevance_score(self, article: Article, authority: float,
+                         has_ai: Optional[bool] = None, has_def: Optional[bool] = None,
+                         hits: Optional[Dict[str, int]] = None) -> float:
+        t = self._normalized(article)
+        if hits is None:
+            hits = keyword_hits(t)
+        sem = sum(hits.values()) / 10.0
+        # bonus co-occurrence (drapeaux déjà calculés par process_entry si fournis)
+        if has_ai is None:
+            has_ai = self._has_ai(t)
+        if has_def is None:
+            has_def = self._has_defense(t)
+        return compute_relevance(sem, authority, self.now_ts - article.date.timestamp(), has_ai and has_def)
+
+    def classify_category(self, text: str, _lower: Optional[str] = None) -> str:
+        t = _lower if _lower is not None else text.lower()
+        for rx, label in CATEGORY_RES:
+            if rx.search(t):
+                return label
         return "TECHNOLOGY"
 
-    def generate_tags(self, article: Article) -> List[str]:
-        t = f"{article.title} {article.summary}".lower()
-        tags = set()
-        if re.search(r"\b(llm|large language model|génératif|generative ai|diffusion model|gan)\b", t):
-            tags.add("LLM/Génératif")
-        if re.search(r"\b(computer vision|vision par ordinateur)\b", t):
-            tags.add("Vision Artificielle")
-        if re.search(r"\b(nlp|traitement du langage|natural language processing)\b", t):
-            tags.add("NLP")
-
-        if re.search(r"\b(naval|marine|navy|sous-?marin|submarine|destroyer|frégate|fregate|maritime)\b", t):
-            tags.add("Naval")
-        if re.search(r"\b(c4isr|c2|isr|command|control|surveillance|reconnaissance)\b", t):
-            tags.add("C4ISR")
-        if re.search(r"\b(cyber|cybersécurité|cybersecurity|ransomware|malware|intrusion)\b", t):
-            tags.add("Cybersécurité")
-        if re.search(r"\b(drone|uav|uas|usv|uuv|unmanned|autonom(?:e|ous)|swarm|essaim)\b", t):
-            tags.add("Systèmes Autonomes")
-
-        if re.search(r"\b(prototype|research|laboratoire|laboratory|paper)\b", t):
-            tags.add("R&D")
-        if re.search(r"\b(deployment|deployed|fielded|operational|opérationnel|exercise|exercice)\b", t):
-            tags.add("Opérationnel")
-
+    def generate_tags(self, article: Article, _lower: Optional[str] = None) -> List[str]:
+        t = _lower if _lower is not None else f"{article.title} {article.summary}".lower()
+        tags = {tag for rx, tag in TAG_RES if rx.search(t)}
         return sorted(tags) if tags else ["—"]
 
     # --- Parsing date ---
-    def _parse_date(self, entry) -> Optional[datetime]:
-        for fld in ("published_parsed", "updated_parsed"):
-            if hasattr(entry, fld) and getattr(entry, fld):
-                import calendar
+    def _parse_date(self, parsed: Iterable, strings: Iterable[str]) -> Optional[datetime]:
+        # parsed : struct_time feedparser (published_parsed, updated_parsed) ;
+        # strings : dates brutes (published, updated, pubDate), essayées dans l'ordre
+        for tm in parsed:
+            if tm:
                 try:
-                    ts = calendar.timegm(getattr(entry, fld))
-                    return datetime.fromtimestamp(ts, tz=timezone.utc)
+                    return datetime.fromtimestamp(calendar.timegm(tm), tz=timezone.utc)
                 except Exception:
                     pass
-        for fld in ("published", "updated", "pubDate"):
-            s = entry.get(fld, "")
+        for s in strings:
             if s:
                 try:
-                    return date_parser.parse(s).astimezone(timezone.utc)
+                    return parse_date_string(s).astimezone(timezone.utc)
                 except Exception:
                     pass
         return None
 
     # --- Pipeline article ---
-    def process_entry(self, entry, src_name: str, meta: Dict) -> Optional[Article]:
-        title = (entry.get("title") or "").strip()
-        link = (entry.get("link") or "").strip()
-        raw = entry.get("summary") or entry.get("description") or ""
+    # Deux étapes autour de la traduction, pour traduire tout un lot d'entrées en un seul appel.
+    def _prepare_entry(self, entry, src_name: str, meta: Dict) -> Optional[PendingEntry]:
+        get = entry.get  # accès FeedParserDict coûteux : champs lus une seule fois
+        title = (get("title") or "").strip()
+        link = (get("link") or "").strip()
+        raw = get("summary") or get("description") or ""
         if not title or not link:
             return None
 
@@ -456,33 +717,50 @@ class ContentAnalyzer:
         sentences = split_sentences(clean)
         base = " ".join(sentences[:2]) if sentences else clean
 
-        # Détection & traduction
-        detected = detect_language_simple(f"{title} {base}")
+        # Rejet rapide avant la traduction (étape la plus coûteuse) sur le texte source.
+        # Exact pour un texte non traduit ; pour un résumé anglais, un terme IA qui n'apparaît
+        # qu'après traduction (« machine-learning » → « apprentissage automatique »,
+        # « LLMs » → « LLM ») n'est plus repêché : l'entrée est rejetée dès ici.
+        if not self._has_ai(normalize_text(f"{title} {base}")):
+            return None
+
+        # Détection (la traduction est faite par lot dans process_entries). Source anglaise :
+        # traduite quoi qu'il arrive, la détection ne servirait qu'à l'étiquette de langue.
+        # Source française : la détection reste utile (articles anglais dans un flux FR).
         src_lang = meta.get("language", "unknown")
-        summary = base
-        translated = False
-        if (src_lang == "en") or (detected == "en"):
-            summary, translated = self.translator.translate_en_to_fr(summary)
+        detected = "en" if src_lang == "en" else detect_language_simple(f"{title} {base}")
+        dt = self._parse_date((get("published_parsed"), get("updated_parsed")),
+                              (get("published"), get("updated"), get("pubDate")))
+        return PendingEntry(src_name, meta, title, link, base, detected, dt,
+                            (src_lang == "en") or (detected == "en"))
+
+    def _finish_entry(self, pending: PendingEntry, summary: str, translated: bool) -> Optional[Article]:
+        src_name, meta = pending.src_name, pending.meta
+        title, link, detected = pending.title, pending.link, pending.language
 
         # Limitation longueur
         if len(summary) > config.max_summary_chars:
             summary = summary[:config.max_summary_chars - 1].rsplit(" ", 1)[0] + "…"
 
         # Date
-        dt = self._parse_date(entry) or datetime.now(timezone.utc)
+        dt = pending.date or self.now
 
-        # Filtres
+        # Filtres définitifs (sur le texte traduit / tronqué) ; formes calculées une fois
+        full = f"{title} {summary}"
+        full_lower = full.lower()
+        norm_all = normalize_text(full)
         title_l = title.lower()
         summary_l = summary.lower()
-        norm_all = normalize_text(f"{title} {summary}")
 
         if self.is_excluded(norm_all):
             return None
         # IA obligatoire + co-occurrence IA/DEF locale (titre ou même phrase)
-        if not self._has_ai(norm_all):
+        has_ai = self._has_ai(norm_all)
+        if not has_ai:
             return None
         if not self._cooccurs_ai_def_in_title_or_sentence(title_l, summary_l):
             return None
+        has_def = self._has_defense(norm_all)
 
         # Construction article
         article = Article(
@@ -493,13 +771,19 @@ class ContentAnalyzer:
             date=dt,
             language=detected,
             translated=translated,
+            normalized=norm_all,
+            ai_defense=has_def,
         )
 
         # Scores
-        article.keyword_score = self._keyword_score(f"{title} {summary}")
-        article.relevance_score = self._relevance_score(article, meta.get("authority", 1.0))
-        article.category = self.classify_category(f"{title} {summary}")
-        article.tags = self.generate_tags(article)
+        hits = keyword_hits(norm_all)
+        article.keyword_score = self._keyword_score(article, hits)
+        article.relevance_score = self._relevance_score(
+            article, meta.get("authority", 1.0),
+            has_ai=has_ai, has_def=has_def, hits=hits,
+        )
+        article.category = self.classify_category(full, _lower=full_lower)
+        article.tags = self.generate_tags(article, _lower=full_lower)
 
         # Priorité
         if article.keyword_score >= 15:
@@ -511,22 +795,208 @@ class ContentAnalyzer:
 
         return article
 
+    def process_batch(self, jobs: List[Tuple[Dict, str, Dict]]) -> Tuple[List[Optional[Article]], List[bool]]:
+        """Analyse un lot d'entrées (entry, source, meta) ; les résumés anglais sont traduits ensemble.
+
+        Renvoie aussi, par entrée, si le résultat est définitif : un résumé anglais resté non
+        traduit alors que la traduction est activée (modèle absent, erreur) ne doit pas être
+        mis en cache, la prochaine exécution le retraduira.
+        """
+        pending = [self._prepare_entry(*job) for job in jobs]
+        to_translate = [p for p in pending if p is not None and p.needs_translation]
+        translations = iter(self.translator.translate_many([p.base for p in to_translate]))
+        articles: List[Optional[Article]] = []
+        final: List[bool] = []
+        for p in pending:
+            if p is None:
+                articles.append(None)
+                final.append(True)
+                continue
+            summary, translated = next(translations) if p.needs_translation else (p.base, False)
+            articles.append(self._finish_entry(p, summary, translated))
+            final.append(translated or not p.needs_translation or not config.offline_translation)
+        return articles, final
+
+    def process_entries(self, jobs: List[Tuple[Dict, str, Dict]]) -> List[Optional[Article]]:
+        return self.process_batch(jobs)[0]
+
+    def process_entry(self, entry, src_name: str, meta: Dict) -> Optional[Article]:
+        return self.process_entries([(entry, src_name, meta)])[0]
+
+# ===================== Parsing flux (rapide) =====================
+
+# Champs réellement utilisés par process_entry : titre, lien, résumé, dates.
+_FEED_ITEM_TAGS = ("{*}item", "{*}entry")
+_SUMMARY_FIELDS = ("description", "summary", "encoded", "content")  # encoded = content:encoded
+_DATE_FIELDS = {"pubDate": "published", "published": "published", "issued": "published",
+                "updated": "updated", "modified": "updated", "date": "updated"}
+
+def _node_text(el) -> str:
+    return "".join(el.itertext())
+
+def _entry_from_element(el) -> Dict[str, str]:
+    fields: Dict[str, str] = {}
+    link = ""
+    guid = ""
+    for child in el:
+        if not isinstance(child.tag, str):
+            continue  # commentaires / instructions de traitement
+        name = etree.QName(child).localname
+        if name == "title" and "title" not in fields:
+            fields["title"] = strip_html(html.unescape(_node_text(child)))
+        elif name == "link" and not link:
+            href = child.get("href")
+            if href is not None:  # Atom
+                if child.get("rel", "alternate") == "alternate":
+                    link = href.strip()
+            else:
+                link = _node_text(child).strip()
+        elif name == "guid" and child.get("isPermaLink", "true") != "false":
+            guid = _node_text(child).strip()
+        elif name in _SUMMARY_FIELDS and name not in fields:
+            fields[name] = _node_text(child)
+        elif name in _DATE_FIELDS and _DATE_FIELDS[name] not in fields:
+            fields[_DATE_FIELDS[name]] = _node_text(child).strip()
+    entry = {"title": fields.get("title", ""), "link": link or guid}
+    summary = next((fields[f] for f in _SUMMARY_FIELDS if fields.get(f)), "")
+    if summary:
+        entry["summary"] = summary
+    for key in ("published", "updated"):
+        if key in fields:
+            entry[key] = fields[key]
+    return entry
+
+def _drain_items(parser: etree.XMLPullParser, entries: List[Dict[str, str]]):
+    for _, el in parser.read_events():
+        entries.append(_entry_from_element(el))
+        # Libère l'élément et ses prédécesseurs : mémoire bornée sur les gros flux
+        el.clear()
+        parent = el.getparent()
+        while parent is not None and el.getprevious() is not None:
+            del parent[0]
+
+def parse_feed_fast(chunks: Iterable[bytes]) -> List[Dict[str, str]]:
+    """Extraction RSS/Atom minimale via lxml (pas de DTD, pas de réseau, pas d'entités externes).
+
+    Le document est consommé par morceaux : les items sont extraits au fil du téléchargement.
+    """
+    parser = etree.XMLPullParser(events=("end",), tag=_FEED_ITEM_TAGS,
+                                 resolve_entities=False, no_network=True, load_dtd=False)
+    entries: List[Dict[str, str]] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        _drain_items(parser, entries)
+    parser.close()
+    _drain_items(parser, entries)
+    return entries
+
+def parse_feed(chunks: Iterable[bytes]) -> feedparser.FeedParserDict:
+    received: List[bytes] = []
+
+    def tee() -> Iterator[bytes]:
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    stream = tee()
+    try:
+        entries = parse_feed_fast(stream)
+        if entries:
+            return feedparser.FeedParserDict(feed={}, entries=entries, bozo=False)
+    except etree.LxmlError as e:
+        logging.info(f"Parsing rapide impossible, repli feedparser: {e}")
+    for _ in stream:  # termine la lecture du corps avant le repli
+        pass
+    feed = feedparser.parse(b"".join(received))
+    if feed.bozo and getattr(feed, "bozo_exception", None):
+        logging.warning(f"Feed partiellement malformé: {feed.bozo_exception}")
+    return feed
+
 # ===================== Collecteur RSS réseau ====================
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 class RSSCollector:
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": config.user_agent})
+        # GET conditionnel : ETag / Last-Modified + dernier corps reçu, persistés entre exécutions
+        self.cache_file = config.cache_dir / "feeds.json"
+        self.body_dir = config.cache_dir / "feeds"
+        self.http_cache: Dict[str, Dict] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        try:
+            return json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Cache HTTP illisible, ignoré: {e}")
+            return {}
+
+    def save_cache(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(self.http_cache, indent=1), encoding="utf-8")
+        except OSError as e:
+            logging.warning(f"Cache HTTP non écrit: {e}")
+
+    def _body_path(self, url: str) -> Path:
+        return self.body_dir / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()}.xml"
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        entry = self.http_cache.get(url)
+        if not entry or not self._body_path(url).exists():
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def _remember(self, url: str, r: requests.Response, chunks: List[bytes]):
+        etag = r.headers.get("ETag")
+        last_modified = r.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self.http_cache.pop(url, None)
+            return
+        try:
+            self.body_dir.mkdir(parents=True, exist_ok=True)
+            self._body_path(url).write_bytes(b"".join(chunks))
+            self.http_cache[url] = {"etag": etag, "last_modified": last_modified}
+        except OSError as e:
+            logging.warning(f"Corps du flux non mis en cache {url}: {e}")
+            self.http_cache.pop(url, None)
+
+    def _download(self, url: str) -> Iterator[bytes]:
+        """Corps du flux par morceaux, au fil de la réception ; mis en cache une fois complet."""
+        r = self.session.get(url, timeout=config.request_timeout,
+                             headers=self._conditional_headers(url), stream=True)
+        if r.status_code == 304:
+            r.close()
+            try:
+                content = self._body_path(url).read_bytes()
+            except OSError:
+                # Copie locale perdue : on oublie les validateurs et on retélécharge
+                self.http_cache.pop(url, None)
+                r = self.session.get(url, timeout=config.request_timeout, stream=True)
+            else:
+                logging.info(f"Flux inchangé (304), copie locale: {url}")
+                yield content
+                return
+        with r:
+            r.raise_for_status()
+            chunks: List[bytes] = []
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                chunks.append(chunk)
+                yield chunk
+            self._remember(url, r, chunks)
 
     def fetch(self, url: str) -> feedparser.FeedParserDict:
         for attempt in range(config.max_retries):
             try:
-                r = self.session.get(url, timeout=config.request_timeout)
-                r.raise_for_status()
-                feed = feedparser.parse(r.content)
-                if feed.bozo and getattr(feed, "bozo_exception", None):
-                    logging.warning(f"Feed partiellement malformé: {feed.bozo_exception}")
-                return feed
+                return parse_feed(self._download(url))
             except requests.RequestException as e:
                 logging.warning(f"[{attempt+1}/{config.max_retries}] Erreur réseau {url}: {e}")
                 if attempt < config.max_retries - 1:
@@ -534,19 +1004,47 @@ class RSSCollector:
         logging.error(f"Échec définitif {url}")
         return feedparser.FeedParserDict(feed={}, entries=[])
 
+    def fetch_all(self, sources: Dict[str, Dict]) -> Dict[str, feedparser.FeedParserDict]:
+        """Télécharge tous les flux en parallèle (I/O réseau) ; clé = nom de source."""
+        results: Dict[str, feedparser.FeedParserDict] = {}
+        with ThreadPoolExecutor(max_workers=max(1, config.fetch_workers)) as ex:
+            futures = {ex.submit(self.fetch, meta["url"]): name for name, meta in sources.items()}
+            for fut in as_completed(futures):
+                results[futures[fut]] = fut.result()
+        self.save_cache()
+        return results
+
 # ======================= Générateur HTML =======================
 
+LEVEL_BADGE = {"HIGH": "bg-red-600", "MEDIUM": "bg-orange-600", "LOW": "bg-green-600"}
+@lru_cache(maxsize=256)
+def escape_label(label: str) -> str:
+    """html.escape mémoïsé pour les valeurs très répétées (sources, catégories)."""
+    return html.escape(label)
+
 class HTMLGenerator:
     def __init__(self, articles: List[Article]):
         self.articles = articles
+        self.stats = self._stats()
 
     def _stats(self) -> Dict:
-        total = len(self.articles)
-        high = sum(1 for a in self.articles if a.priority_level == "HIGH")
-        translated = sum(1 for a in self.articles if a.translated)
-        sources = len({a.source for a in self.articles})
-        avg_rel = round(sum(a.relevance_score for a in self.articles) / max(1, total), 3)
-        return dict(total=total, high=high, translated=translated, sources=sources, avg=avg_rel)
+        # Un seul parcours des articles pour tous les agrégats de l'en-tête
+        total = high = translated = 0
+        rel_sum = 0.0
+        sources: Set[str] = set()
+        categories: Set[str] = set()
+        for a in self.articles:
+            total += 1
+            if a.priority_level == "HIGH":
+                high += 1
+            if a.translated:
+                translated += 1
+            rel_sum += a.relevance_score
+            sources.add(a.source)
+            categories.add(a.category)
+        avg_rel = round(rel_sum / max(1, total), 3)
+        return dict(total=total, high=high, translated=translated, sources=len(sources),
+                    avg=avg_rel, categories=sorted(categories))
 
     def _header(self, stats: Dict) -> str:
         generated = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
@@ -568,30 +1066,30 @@ class HTMLGenerator:
 """
 
     def _filters(self) -> str:
-        cats = sorted({a.category for a in self.articles})
-        cat_opts = "".join(f"<option value='{html.escape(c)}'>{html.escape(c)}</option>" for c in cats)
+        stats = self.stats
+        cat_opts = "".join(f"<option value='{escape_label(c)}'>{escape_label(c)}</option>" for c in stats["categories"])
         return f"""
 <main class="max-w-7xl mx-auto px-4 py-6">
   <div class="grid grid-cols-1 md:grid-cols-5 gap-4 mb-6">
     <div class="bg-white rounded shadow p-4 text-center">
-      <div class="text-3xl font-bold text-blue-700">{len(self.articles)}</div>
+      <div class="text-3xl font-bold text-blue-700">{stats['total']}</div>
       <div class="text-gray-600">Articles</div>
     </div>
     <div class="bg-white rounded shadow p-4 text-center">
-      <div class="text-3xl font-bold text-red-600">{sum(1 for a in self.articles if a.priority_level=='HIGH')}</div>
+      <div class="text-3xl font-bold text-red-600">{stats['high']}</div>
       <div class="text-gray-600">Priorité Haute</div>
     </div>
     <div class="bg-white rounded shadow p-4 text-center">
-      <div class="text-3xl font-bold text-green-600">{len({a.source for a in self.articles})}</div>
+      <div class="text-3xl font-bold text-green-600">{stats['sources']}</div>
       <div class="text-gray-600">Sources actives</div>
     </div>
     <div class="bg-white rounded shadow p-4 text-center">
-      <div class="text-3xl font-bold text-purple-600">{sum(1 for a in self.articles if a.translated)}</div>
+      <div class="text-3xl font-bold text-purple-600">{stats['translated']}</div>
       <div class="text-gray-600">Traduit FR</div>
     </div>
     <div class="bg-white rounded shadow p-4 text-center">
       <div class="text-sm text-gray-600">Pertinence moyenne</div>
-      <div class="text-xl font-semibold">{round(sum(a.relevance_score for a in self.articles)/max(1,len(self.articles)),3)}</div>
+      <div class="text-xl font-semibold">{stats['avg']}</div>
     </div>
   </div>
 
@@ -613,27 +1111,31 @@ class HTMLGenerator:
   </div>
 """
 
-    def _table(self) -> str:
-        def level_badge(lv: str) -> str:
-            return {"HIGH": "bg-red-600", "MEDIUM": "bg-orange-600", "LOW": "bg-green-600"}.get(lv, "bg-gray-600")
-        rows = []
-        for a in self.articles:
-            t_badge = ' <span class="ml-2 px-2 py-0.5 rounded text-xs text-white" style="background:#6d28d9">🇫🇷 Traduit</span>' if a.translated else ""
-            rows.append(
-                "<tr class='hover:bg-gray-50' "
-                f"data-level='{a.priority_level}' data-source='{html.escape(a.source)}' data-cat='{html.escape(a.category)}'>"
-                f"<td class='p-3 text-sm text-gray-600'>{a.date.strftime('%Y-%m-%d')}</td>"
-                f"<td class='p-3 text-xs'><span class='bg-blue-100 text-blue-800 px-2 py-1 rounded'>{html.escape(a.source)}</span></td>"
-                f"<td class='p-3'><a class='text-blue-700 hover:underline font-semibold' target='_blank' href='{html.escape(a.link)}'>{html.escape(a.title)}</a></td>"
-                f"<td class='p-3 text-sm text-gray-800'>{html.escape(a.summary)}{t_badge}</td>"
-                f"<td class='p-3 text-center'><span class='bg-indigo-100 text-indigo-800 px-2 py-1 rounded text-sm font-bold'>{a.keyword_score}</span></td>"
-                f"<td class='p-3 text-center'><span class='text-white px-2 py-1 rounded text-xs {level_badge(a.priority_level)}'>{a.priority_level}</span></td>"
-                f"<td class='p-3 text-sm'><span class='px-2 py-1 rounded text-white text-xs' style='background:#0f766e'>{html.escape(a.category)}</span></td>"
-                f"<td class='p-3 text-center text-sm'><span class='bg-gray-100 text-gray-800 px-2 py-1 rounded'>{round(a.relevance_score,3)}</span></td>"
-                f"<td class='p-3 text-sm'>{html.escape(', '.join(a.tags) if a.tags else '—')}</td>"
-                "</tr>"
-            )
-        return f"""
+    def _payload(self) -> str:
+        """Articles sérialisés en un seul bloc JSON, rendus côté client."""
+        data = [
+            {
+                "date": a.date.strftime("%Y-%m-%d"),
+                "source": a.source,
+                "title": a.title,
+                "link": a.link,
+                "summary": a.summary,
+                "translated": a.translated,
+                "score": a.keyword_score,
+                "level": a.priority_level,
+                "category": a.category,
+                "relevance": str(round(a.relevance_score, 3)),
+                "tags": ", ".join(a.tags) if a.tags else "—",
+            }
+            for a in self.articles
+        ]
+        payload = json.dumps({"levels": LEVEL_BADGE, "articles": data},
+                             ensure_ascii=False, separators=(",", ":"))
+        # "<" échappé : le contenu ne peut ni fermer la balise <script> ni ouvrir un commentaire
+        return payload.replace("<", "\\u003c")
+
+    def _table_head(self) -> str:
+        return """
   <div class="bg-white rounded shadow overflow-x-auto">
     <table class="min-w-full">
       <thead class="bg-blue-50">
@@ -649,9 +1151,10 @@ class HTMLGenerator:
           <th class="text-left p-3">Tags</th>
         </tr>
       </thead>
-      <tbody id="tbody">
-        {''.join(rows)}
-      </tbody>
+      <tbody id="tbody"></tbody>"""
+
+    def _table_tail(self) -> str:
+        return """
     </table>
   </div>
 </main>
@@ -661,56 +1164,83 @@ class HTMLGenerator:
         return """
 <script>
 (function() {
-  const rows = Array.from(document.querySelectorAll("#tbody tr"));
+  const payload = JSON.parse(document.getElementById("data").textContent);
+  const articles = payload.articles;
+  const tbody = document.getElementById("tbody");
   const q = document.getElementById("q");
   const level = document.getElementById("level");
   const source = document.getElementById("source");
   const cat = document.getElementById("cat");
 
+  function el(tag, cls, text) {
+    const e = document.createElement(tag);
+    if (cls) e.className = cls;
+    if (text !== undefined) e.textContent = text;
+    return e;
+  }
+  function cell(cls, child) {
+    const td = el("td", cls);
+    td.appendChild(child);
+    return td;
+  }
+
+  // Rendu unique des lignes ; les filtres ne font ensuite que basculer leur affichage
+  const frag = document.createDocumentFragment();
+  const rows = articles.map(a => {
+    const tr = el("tr", "hover:bg-gray-50");
+    tr.appendChild(el("td", "p-3 text-sm text-gray-600", a.date));
+    tr.appendChild(cell("p-3 text-xs", el("span", "bg-blue-100 text-blue-800 px-2 py-1 rounded", a.source)));
+    const link = el("a", "text-blue-700 hover:underline font-semibold", a.title);
+    link.target = "_blank";
+    link.setAttribute("href", a.link);
+    tr.appendChild(cell("p-3", link));
+    const summary = el("td", "p-3 text-sm text-gray-800", a.summary);
+    if (a.translated) {
+      const badge = el("span", "ml-2 px-2 py-0.5 rounded text-xs text-white", "🇫🇷 Traduit");
+      badge.style.background = "#6d28d9";
+      summary.append(" ", badge);
+    }
+    tr.appendChild(summary);
+    tr.appendChild(cell("p-3 text-center", el("span", "bg-indigo-100 text-indigo-800 px-2 py-1 rounded text-sm font-bold", String(a.score))));
+    tr.appendChild(cell("p-3 text-center", el("span", "text-white px-2 py-1 rounded text-xs " + (payload.levels[a.level] || "bg-gray-600"), a.level)));
+    const category = el("span", "px-2 py-1 rounded text-white text-xs", a.category);
+    category.style.background = "#0f766e";
+    tr.appendChild(cell("p-3 text-sm", category));
+    tr.appendChild(cell("p-3 text-center text-sm", el("span", "bg-gray-100 text-gray-800 px-2 py-1 rounded", a.relevance)));
+    tr.appendChild(el("td", "p-3 text-sm", a.tags));
+    frag.appendChild(tr);
+    a.text = [a.date, a.source, a.title, a.summary, a.translated ? "🇫🇷 Traduit" : "", a.score,
+              a.level, a.category, a.relevance, a.tags].join(" ").toLowerCase();
+    a.visible = true;
+    return tr;
+  });
+  tbody.appendChild(frag);
+
   function applyFilters() {
     const qv = (q.value || "").toLowerCase();
     const lv = level.value;
     const sv = (source.value || "").toLowerCase();
     const cv = cat.value;
-    rows.forEach(tr => {
-      const t = tr.innerText.toLowerCase();
-      const rl = tr.getAttribute("data-level") || "";
-      const rs = (tr.getAttribute("data-source") || "").toLowerCase();
-      const rc = tr.getAttribute("data-cat") || "";
+    articles.forEach((a, i) => {
       let ok = true;
-      if (qv && !t.includes(qv)) ok = false;
-      if (lv && rl !== lv) ok = false;
-      if (sv && !rs.includes(sv)) ok = false;
-      if (cv && rc !== cv) ok = false;
-      tr.style.display = ok ? "" : "none";
+      if (qv && !a.text.includes(qv)) ok = false;
+      if (lv && a.level !== lv) ok = false;
+      if (sv && !a.source.toLowerCase().includes(sv)) ok = false;
+      if (cv && a.category !== cv) ok = false;
+      if (ok !== a.visible) {
+        a.visible = ok;
+        rows[i].style.display = ok ? "" : "none";
+      }
     });
   }
   [q, level, source, cat].forEach(el => el.addEventListener("input", applyFilters));
 
   document.getElementById("btnCsv").addEventListener("click", () => {
     const header = ["Titre","Lien","Date","Source","Résumé","Niveau","Score","Catégorie","Pertinence","Tags"];
-    const table = document.querySelector("#tbody");
-    const data = [];
-    for (const tr of table.querySelectorAll("tr")) {
-      if (tr.style.display === "none") continue;
-      const tds = tr.querySelectorAll("td");
-      if (tds.length < 9) continue;
-      const titre = tds[2].innerText.trim();
-      const lienA = tds[2].querySelector("a");
-      const lien = lienA ? lienA.getAttribute("href") : "";
-      const row = [
-        titre, lien,
-        tds[0].innerText.trim(),
-        tds[1].innerText.trim(),
-        tds[3].innerText.trim(),
-        tds[5].innerText.trim(),
-        tds[4].innerText.trim(),
-        tds[6].innerText.trim(),
-        tds[7].innerText.trim(),
-        tds[8].innerText.trim()
-      ];
-      data.push(row);
-    }
+    const data = articles.filter(a => a.visible).map(a => [
+      a.title, a.link, a.date, a.source, a.summary + (a.translated ? " 🇫🇷 Traduit" : ""),
+      a.level, a.score, a.category, a.relevance, a.tags
+    ]);
     const csv = [header, ...data].map(r => r.map(x => '"' + String((x==null ? "" : x)).replace(/"/g,'""') + '"').join(",")).join("\\n");
     const blob = new Blob([csv], {type: "text/csv;charset=utf-8"});
     const url = URL.createObjectURL(blob);
@@ -722,8 +1252,8 @@ class HTMLGenerator:
 </script>
 """
 
-    def build(self) -> str:
-        return f"""<!doctype html>
+    def _head(self) -> str:
+        return """<!doctype html>
 <html lang="fr">
 <head>
   <meta charset="utf-8">
@@ -731,64 +1261,227 @@ class HTMLGenerator:
   <title>Veille IA – Militaire</title>
   <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
   <style>
-    .summary-cell {{
+    .summary-cell {
       max-height: 4.5rem;
       overflow: hidden;
       display: -webkit-box;
       -webkit-line-clamp: 3;
       -webkit-box-orient: vertical;
       line-height: 1.5;
-    }}
+    }
   </style>
 </head>
 <body class="bg-gray-50">
-  {self._header(self._stats())}
-  {self._filters()}
-  {self._table()}
-  {self._scripts()}
-</body>
-</html>
-"""
+  """
+
+    def write(self, fp) -> None:
+        """Écrit la page section par section ; les articles forment un seul bloc JSON (cf. _payload)."""
+        w = fp.write
+        w(self._head())
+        w(self._header(self.stats))
+        w("\n  ")
+        w(self._filters())
+        w("\n  ")
+        w(self._table_head())
+        w(self._table_tail())
+        w('\n  <script id="data" type="application/json">')
+        w(self._payload())
+        w("</script>\n  ")
+        w(self._scripts())
+        w("\n</body>\n</html>\n")
+
+# ============== Cache d'analyse (entre exécutions) ==============
+
+class ArticleCache:
+    """Résultat d'analyse des entrées déjà vues, hors fraîcheur (recalculée à chaque exécution).
+
+    La clé couvre tout ce dont dépend process_entry (entrée brute, source, réglages, code) :
+    une modification du script invalide le cache.
+    """
+
+    _ARTICLE_FIELDS = ("title", "link", "summary", "source", "language", "translated",
+                       "keyword_score", "priority_level", "category", "tags", "ai_defense")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fingerprint = "|".join((
+            hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest(),
+            str(config.max_summary_chars), str(config.offline_translation),
+        ))
+        self.records: Dict[str, Optional[Dict]] = self._load()
+        self.used: Dict[str, Optional[Dict]] = {}
+        self.hits = 0
+
+    def _load(self) -> Dict[str, Optional[Dict]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache d'analyse illisible, ignoré: {e}")
+            return {}
+        if data.get("fingerprint") != self.fingerprint:
+            return {}
+        return data.get("records", {})
+
+    def save(self):
+        # Seules les entrées encore présentes dans les flux sont conservées
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps({"fingerprint": self.fingerprint, "records": self.used}),
+                                 encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Cache d'analyse non écrit: {e}")
+
+    @staticmethod
+    def key(entry, src_name: str, meta: Dict) -> str:
+        parts = [src_name, meta.get("language", "unknown")]
+        parts += [str(entry.get(f) or "") for f in ("title", "link", "summary", "description",
+                                                   "published", "updated", "pubDate")]
+        return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def lookup(self, key: str) -> Tuple[bool, Optional[Dict]]:
+        if key in self.records:
+            self.hits += 1
+            record = self.used[key] = self.records[key]
+            return True, record
+        return False, None
+
+    def store(self, key: str, article: Optional[Article], now: datetime):
+        if article is None:
+            self.used[key] = None
+            return
+        record = {f: getattr(article, f) for f in self._ARTICLE_FIELDS}
+        # Entrée sans date : process_entry a pris l'horloge de l'exécution, à reprendre telle quelle
+        record["date"] = None if article.date == now else article.date.isoformat()
+        self.used[key] = record
+
+    @staticmethod
+    def restore(record: Dict, meta: Dict, now: datetime) -> Article:
+        fields = {f: record[f] for f in ArticleCache._ARTICLE_FIELDS}
+        date = now if record["date"] is None else datetime.fromisoformat(record["date"])
+        article = Article(date=date, **fields)
+        article.relevance_score = compute_relevance(
+            article.keyword_score / 10.0, meta.get("authority", 1.0),
+            now.timestamp() - date.timestamp(), article.ai_defense,
+        )
+        return article
+
+# ================= Analyse parallèle (processus) =================
+
+ANALYSIS_BATCH = 32
+
+# Un analyseur par processus : le modèle Argos ne se sérialise pas, il est chargé dans l'initializer.
+_worker_analyzer: Optional[ContentAnalyzer] = None
+
+def _init_analysis_worker(now: datetime, translations: Optional[Dict[str, str]]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = ContentAnalyzer(now=now, translations=translations)
+
+def _analyze_batch(jobs: List[Tuple[Dict, str, Dict]]) -> Tuple[List[Optional[Article]], List[bool], Dict[str, str]]:
+    # Les traductions servies repartent vers le processus principal, seul à écrire le cache
+    articles, final = _worker_analyzer.process_batch(jobs)
+    return articles, final, _worker_analyzer.translator.take_used()
+
+def _analyze(jobs: List[Tuple[Dict, str, Dict]], now: datetime,
+             translations: Optional[TranslationCache]) -> Iterator[Tuple[Optional[Article], bool]]:
+    """(article, résultat définitif) par entrée, dans l'ordre des jobs (cf. process_batch)."""
+    # Lots d'entrées : unité de traduction (un translate_batch) et de répartition entre processus
+    batches = [jobs[i:i + ANALYSIS_BATCH] for i in range(0, len(jobs), ANALYSIS_BATCH)]
+    workers = min(config.analysis_workers, len(batches))
+    known = translations.translations() if translations is not None else None
+    now_ts = now.timestamp()
+    if workers <= 1:
+        analyzer = ContentAnalyzer(now=now, translations=known)
+        for batch in batches:
+            yield from zip(*analyzer.process_batch(batch))
+            if translations is not None:
+                translations.update(analyzer.translator.take_used(), now_ts)
+        return
+    logger.info(f"Analyse sur {workers} processus")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_analysis_worker,
+                             initargs=(now, known)) as ex:
+        for articles, final, used in ex.map(_analyze_batch, batches):
+            if translations is not None:
+                translations.update(used, now_ts)
+            yield from zip(articles, final)
+
+def analyze_all(jobs: List[Tuple[Dict, str, Dict]], now: datetime,
+                cache: Optional[ArticleCache] = None,
+                translations: Optional[TranslationCache] = None) -> Iterator[Optional[Article]]:
+    """Analyse les entrées dans l'ordre ; ANALYSIS_WORKERS > 1 répartit le travail sur des processus.
+
+    Avec un cache, seules les entrées inconnues sont analysées ; les autres sont reconstruites.
+    """
+    if cache is None:
+        for art, _ in _analyze(jobs, now, translations):
+            yield art
+        return
+    lookups = []
+    for job in jobs:
+        key = cache.key(*job)
+        lookups.append((key, *cache.lookup(key)))
+    fresh = _analyze([job for job, (_, hit, _) in zip(jobs, lookups) if not hit], now, translations)
+    for (_, _, meta), (key, hit, record) in zip(jobs, lookups):
+        if hit:
+            yield None if record is None else ArticleCache.restore(record, meta, now)
+        else:
+            art, final = next(fresh)
+            if final:
+                cache.store(key, art, now)
+            yield art
+    fresh.close()
+    logger.info(f"Cache d'analyse : {cache.hits}/{len(jobs)} entrées reprises")
 
 # =========================== Main ==============================
 
 def main():
     logger.info(f"CFG days_window={config.days_window} relevance_min={config.relevance_min} offline_translation={config.offline_translation}")
     collector = RSSCollector()
-    analyzer = ContentAnalyzer()
+    now = datetime.now(timezone.utc)
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=config.days_window)
-    seen: Set[str] = set()
+    cutoff_ts = (now - timedelta(days=config.days_window)).timestamp()
+    seen: Set[int] = set()
     kept: List[Article] = []
 
-    total_seen = 0
+    # Téléchargements concurrents, traitement dans l'ordre de RSS_SOURCES (dédup stable)
+    feeds = collector.fetch_all(RSS_SOURCES)
+
+    jobs: List[Tuple[Dict, str, Dict]] = []
     for src_name, meta in RSS_SOURCES.items():
-        url = meta["url"]
-        feed = collector.fetch(url)
+        feed = feeds[src_name]
         entries = getattr(feed, "entries", []) or []
         logger.info(f"Source {src_name}: {len(entries)} entrées")
-        total_seen += len(entries)
-
-        for entry in entries:
-            art = analyzer.process_entry(entry, src_name, meta)
-            if not art:
-                continue
-            if art.date < cutoff:
-                continue
-            if art.relevance_score < config.relevance_min:
-                continue
-            if art.hash_id in seen:
-                continue
-            seen.add(art.hash_id)
-            kept.append(art)
+        jobs.extend((entry, src_name, meta) for entry in entries)
+    total_seen = len(jobs)
+
+    cache = ArticleCache(config.cache_dir / "articles.json") if config.article_cache else None
+    translations = (TranslationCache(config.cache_dir / "translations.json")
+                    if config.offline_translation and config.translation_cache else None)
+    for art in analyze_all(jobs, now, cache, translations):
+        if not art:
+            continue
+        if art.date.timestamp() < cutoff_ts:
+            continue
+        if art.relevance_score < config.relevance_min:
+            continue
+        key = art.hash_id
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(art)
+    if cache is not None:
+        cache.save()
+    if translations is not None:
+        translations.save(now.timestamp())
 
     # Tri : pertinence desc, date desc, keyword_score desc
-    kept.sort(key=lambda a: (a.relevance_score, a.date, a.keyword_score), reverse=True)
+    kept.sort(key=attrgetter("relevance_score", "date", "keyword_score"), reverse=True)
 
     # Génération HTML
     config.output_dir.mkdir(parents=True, exist_ok=True)
-    html_page = HTMLGenerator(kept).build()
-    (config.output_dir / config.output_file).write_text(html_page, encoding="utf-8")
+    with (config.output_dir / config.output_file).open("w", encoding="utf-8") as fp:
+        HTMLGenerator(kept).write(fp)
 
     logger.info(f"Articles récupérés : {total_seen} • conservés : {len(kept)}")
     logger.info(f"✅ Rapport écrit dans {config.output_dir / config.output_file}")